@@ -12,8 +12,12 @@ This file demonstrates:
   4. Querying all pests affecting a specific crop.
   5. Submitting farmer queries to FarmerAssistant for advisory responses.
 
+The demos are independent, so they run concurrently by default; each
+returns its buffered output and main() prints the results in order.
+
 Run directly:
-    python examples/quickstart.py
+    python examples/quickstart.py          # concurrent
+    python examples/quickstart.py --serial # one demo at a time
 
 Install first:
     pip install aumai-kisanmitra
@@ -21,7 +25,14 @@ Install first:
 
 from __future__ import annotations
 
-from aumai_kisanmitra.core import FarmerAssistant, MandiPriceTracker, PestDatabase
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from aumai_kisanmitra.core import (
+    MandiPriceTracker,
+    get_farmer_assistant,
+    get_pest_database,
+)
 from aumai_kisanmitra.models import (
     AGRICULTURAL_DISCLAIMER,
     FarmerQuery,
@@ -33,13 +44,13 @@ from aumai_kisanmitra.models import (
 # Demo 1: Loading mandi prices and filtering by commodity + state
 # ---------------------------------------------------------------------------
 
-def demo_mandi_price_query() -> None:
+def demo_mandi_price_query() -> str:
     """Populate MandiPriceTracker with sample records and query by commodity.
 
     MandiPrice records use INR per quintal (100 kg).  min_price, max_price,
     and modal_price mirror the three-price format published by AGMARKNET.
     """
-    print("\n--- Demo 1: Mandi Price Query ---")
+    out = ["\n--- Demo 1: Mandi Price Query ---"]
 
     tracker = MandiPriceTracker()
 
@@ -87,33 +98,34 @@ def demo_mandi_price_query() -> None:
 
     # Query wheat prices across all states (returned newest-first).
     all_wheat = tracker.get_prices("Wheat")
-    print(f"  Wheat records (all states): {len(all_wheat)}")
-    for price in all_wheat:
-        print(
-            f"    {price.market}, {price.state}: "
-            f"modal=Rs {price.modal_price}/quintal  ({price.date})"
-        )
+    out.append(f"  Wheat records (all states): {len(all_wheat)}")
+    out.extend(
+        f"    {price.market}, {price.state}: "
+        f"modal=Rs {price.modal_price}/quintal  ({price.date})"
+        for price in all_wheat
+    )
 
     # Narrow to Punjab only.
     punjab_wheat = tracker.get_prices("Wheat", state="Punjab")
-    print(f"\n  Wheat in Punjab: {len(punjab_wheat)} record(s)")
+    out.append(f"\n  Wheat in Punjab: {len(punjab_wheat)} record(s)")
     if punjab_wheat:
         best = punjab_wheat[0]
-        print(f"    Latest: {best.market} — Rs {best.modal_price}/quintal")
+        out.append(f"    Latest: {best.market} — Rs {best.modal_price}/quintal")
+    return "\n".join(out)
 
 
 # ---------------------------------------------------------------------------
 # Demo 2: Price trend at a specific mandi
 # ---------------------------------------------------------------------------
 
-def demo_price_trend() -> None:
+def demo_price_trend() -> str:
     """Show price movement at a single mandi across multiple dates.
 
     price_trend() returns records in chronological order (oldest first),
     making it straightforward to compute day-over-day changes or plot a
     time series for a decision-support dashboard.
     """
-    print("\n--- Demo 2: Price Trend at Khanna Mandi ---")
+    out = ["\n--- Demo 2: Price Trend at Khanna Mandi ---"]
 
     tracker = MandiPriceTracker()
 
@@ -137,82 +149,85 @@ def demo_price_trend() -> None:
         ))
 
     trend = tracker.price_trend("Wheat", "Khanna")
-    print(f"  {'Date':<12} {'Min':>8} {'Modal':>8} {'Max':>8}  (INR/quintal)")
-    print(f"  {'-'*12} {'-'*8} {'-'*8} {'-'*8}")
-    for price in trend:
-        print(
-            f"  {price.date:<12} "
-            f"{price.min_price:>8.0f} "
-            f"{price.modal_price:>8.0f} "
-            f"{price.max_price:>8.0f}"
-        )
+    out.append(f"  {'Date':<12} {'Min':>8} {'Modal':>8} {'Max':>8}  (INR/quintal)")
+    out.append(f"  {'-'*12} {'-'*8} {'-'*8} {'-'*8}")
+    out.extend(
+        f"  {price.date:<12} "
+        f"{price.min_price:>8.0f} "
+        f"{price.modal_price:>8.0f} "
+        f"{price.max_price:>8.0f}"
+        for price in trend
+    )
+    return "\n".join(out)
 
 
 # ---------------------------------------------------------------------------
 # Demo 3: Pest identification from field symptoms
 # ---------------------------------------------------------------------------
 
-def demo_pest_identification() -> None:
+def demo_pest_identification() -> str:
     """Identify likely pests from symptoms observed in the field.
 
     PestDatabase.identify() scores each pest by the number of symptom
     keywords that overlap with the observed set, then returns results ranked
     by score.  Verify top matches with your local KVK or agriculture officer.
     """
-    print("\n--- Demo 3: Pest Identification by Symptom ---")
+    out = ["\n--- Demo 3: Pest Identification by Symptom ---"]
 
-    db = PestDatabase()
+    db = get_pest_database()
 
     # Symptoms reported by a rice farmer.
     observed_symptoms = ["yellowing", "wilting", "hopperburn"]
     matches = db.identify(observed_symptoms)
 
-    print(f"  Observed symptoms: {observed_symptoms}")
-    print(f"  Top {min(3, len(matches))} matching pests:")
+    out.append(f"  Observed symptoms: {observed_symptoms}")
+    out.append(f"  Top {min(3, len(matches))} matching pests:")
     for pest in matches[:3]:
-        print(f"\n    Pest     : {pest.name}")
-        print(f"    Crops    : {', '.join(pest.affected_crops)}")
-        print(f"    Treatment: {pest.treatment[0]}")
-        print(f"    Prevention: {pest.prevention[0]}")
+        out.append(f"\n    Pest     : {pest.name}")
+        out.append(f"    Crops    : {', '.join(pest.affected_crops)}")
+        out.append(f"    Treatment: {pest.treatment[0]}")
+        out.append(f"    Prevention: {pest.prevention[0]}")
 
-    print(f"\n  {AGRICULTURAL_DISCLAIMER}")
+    out.append(f"\n  {AGRICULTURAL_DISCLAIMER}")
+    return "\n".join(out)
 
 
 # ---------------------------------------------------------------------------
 # Demo 4: All pests for a given crop
 # ---------------------------------------------------------------------------
 
-def demo_pests_by_crop() -> None:
+def demo_pests_by_crop() -> str:
     """List every pest in the database that affects a given crop.
 
     Use this to generate crop-specific pest management schedules or to
     populate training data for a crop-advisory chatbot.
     """
-    print("\n--- Demo 4: Pests Affecting Cotton ---")
+    out = ["\n--- Demo 4: Pests Affecting Cotton ---"]
 
-    db = PestDatabase()
+    db = get_pest_database()
     cotton_pests = db.by_crop("Cotton")
 
-    print(f"  {len(cotton_pests)} pests found for Cotton:")
+    out.append(f"  {len(cotton_pests)} pests found for Cotton:")
     for pest in cotton_pests:
         symptom_count = f"({len(pest.symptoms)} symptoms known)"
-        print(f"    - {pest.name} {symptom_count}")
+        out.append(f"    - {pest.name} {symptom_count}")
+    return "\n".join(out)
 
 
 # ---------------------------------------------------------------------------
 # Demo 5: Farmer advisory assistant
 # ---------------------------------------------------------------------------
 
-def demo_farmer_assistant() -> None:
+def demo_farmer_assistant() -> str:
     """Submit natural-language queries to FarmerAssistant and display responses.
 
     FarmerAssistant uses keyword matching to route queries to curated
     advisory responses with source references.  An optional location field
     appends a localised follow-up suggestion pointing to the nearest KVK.
     """
-    print("\n--- Demo 5: Farmer Advisory Assistant ---")
+    out = ["\n--- Demo 5: Farmer Advisory Assistant ---"]
 
-    assistant = FarmerAssistant()
+    assistant = get_farmer_assistant()
 
     queries = [
         FarmerQuery(
@@ -233,32 +248,51 @@ def demo_farmer_assistant() -> None:
 
     for farmer_query in queries:
         response = assistant.respond(farmer_query)
-        print(f"\n  Query   : {farmer_query.query}")
-        print(f"  Answer  : {response.answer[:160]}...")
-        print(f"  Sources : {', '.join(response.sources)}")
+        out.append(f"\n  Query   : {farmer_query.query}")
+        out.append(f"  Answer  : {response.answer[:160]}...")
+        out.append(f"  Sources : {', '.join(response.sources)}")
 
-    print(f"\n  Disclaimer: {AGRICULTURAL_DISCLAIMER}")
+    out.append(f"\n  Disclaimer: {AGRICULTURAL_DISCLAIMER}")
+    return "\n".join(out)
 
 
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
-def main() -> None:
-    """Run all five kisanmitra quickstart demonstrations."""
-    print("=" * 60)
-    print("aumai-kisanmitra quickstart")
-    print("Farmer mobile assistant — mandi prices, pest ID, advisory")
-    print("=" * 60)
+_BANNER = "\n".join((
+    "=" * 60,
+    "aumai-kisanmitra quickstart",
+    "Farmer mobile assistant — mandi prices, pest ID, advisory",
+    "=" * 60,
+))
 
-    demo_mandi_price_query()
-    demo_price_trend()
-    demo_pest_identification()
-    demo_pests_by_crop()
-    demo_farmer_assistant()
 
+def main(serial: bool = False) -> None:
+    """Run all five kisanmitra quickstart demonstrations.
+
+    Each demo owns its own tracker/database and only returns text, so by
+    default they run concurrently on a thread pool and the buffered
+    outputs are printed in the original order.  Pass serial=True (the
+    --serial flag) to run them one at a time when debugging.
+    """
+    demos = (
+        demo_mandi_price_query,
+        demo_price_trend,
+        demo_pest_identification,
+        demo_pests_by_crop,
+        demo_farmer_assistant,
+    )
+
+    print(_BANNER)
+    if serial:
+        outputs = [demo() for demo in demos]
+    else:
+        with ThreadPoolExecutor(max_workers=len(demos)) as executor:
+            outputs = list(executor.map(lambda demo: demo(), demos))
+    print("\n".join(outputs))
     print("\nDone.")
 
 
 if __name__ == "__main__":
-    main()
+    main(serial="--serial" in sys.argv[1:])
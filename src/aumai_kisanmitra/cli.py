@@ -2,13 +2,75 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import re
 import sys
+from collections.abc import Iterator
 from datetime import date
+from typing import TYPE_CHECKING
 
 import click
 
-from .core import FarmerAssistant, MandiPriceTracker, PestDatabase
-from .models import AGRICULTURAL_DISCLAIMER, FarmerQuery, MandiPrice
+# Package imports are deferred into the individual commands so that each
+# subcommand (and --help/--version) only pays for the modules it uses.
+if TYPE_CHECKING:
+    from .models import MandiPrice, PestInfo
+
+
+# Bound .format methods so the format specs are parsed once at import
+# rather than on every row of the prices table.
+_PRICE_HEADER = "{:<20} {:<15} {:>8} {:>8} {:>8} {:<12}".format
+_PRICE_ROW = "{:<20} {:<15} {:>8.0f} {:>8.0f} {:>8.0f} {:<12}".format
+
+# Splits comma-separated symptom input, absorbing surrounding whitespace in
+# the same pass.
+_SYMPTOM_SEP = re.compile(r"\s*,\s*")
+
+
+@functools.lru_cache(maxsize=1)
+def _today_iso() -> str:
+    """Return today's date in ISO form, computed once per process."""
+    return date.today().isoformat()
+
+
+@functools.lru_cache(maxsize=1)
+def _sample_prices() -> tuple[MandiPrice, ...]:
+    """Build the demonstration price records, dated today, once per process."""
+    from .models import MandiPrice
+
+    today = _today_iso()
+    return (
+        MandiPrice(commodity="rice", market="Azadpur", state="Delhi", min_price=1800.0, max_price=2200.0, modal_price=2000.0, date=today),
+        MandiPrice(commodity="rice", market="Lucknow", state="UP", min_price=1750.0, max_price=2100.0, modal_price=1950.0, date=today),
+        MandiPrice(commodity="rice", market="Patna", state="Bihar", min_price=1700.0, max_price=2050.0, modal_price=1900.0, date=today),
+        MandiPrice(commodity="wheat", market="Azadpur", state="Delhi", min_price=2000.0, max_price=2350.0, modal_price=2150.0, date=today),
+        MandiPrice(commodity="wheat", market="Lucknow", state="UP", min_price=1950.0, max_price=2300.0, modal_price=2100.0, date=today),
+        MandiPrice(commodity="cotton", market="Akola", state="Maharashtra", min_price=6000.0, max_price=6800.0, modal_price=6400.0, date=today),
+        MandiPrice(commodity="cotton", market="Warangal", state="Telangana", min_price=5900.0, max_price=6700.0, modal_price=6300.0, date=today),
+        MandiPrice(commodity="onion", market="Nashik", state="Maharashtra", min_price=1200.0, max_price=2000.0, modal_price=1600.0, date=today),
+        MandiPrice(commodity="potato", market="Agra", state="UP", min_price=800.0, max_price=1200.0, modal_price=1000.0, date=today),
+    )
+
+
+def _format_pest(index: int, pest_info: PestInfo) -> Iterator[str]:
+    """Yield the output lines for one pest identification result."""
+    yield "\n" + "=" * 50
+    yield f"{index}. {pest_info.name}"
+    yield f"   Affected Crops: {', '.join(pest_info.affected_crops)}"
+    yield f"   Symptoms: {'; '.join(pest_info.symptoms)}"
+    yield "   Treatment:"
+    yield from (f"     - {t}" for t in pest_info.treatment)
+    yield "   Prevention:"
+    yield from (f"     - {p_item}" for p_item in pest_info.prevention)
+
+
+@functools.lru_cache(maxsize=1)
+def _disclaimer_block() -> str:
+    """Return the disclaimer wrapped in blank lines, built once per process."""
+    from .models import AGRICULTURAL_DISCLAIMER
+
+    return f"\n{AGRICULTURAL_DISCLAIMER}\n"
 
 
 @click.group()
@@ -22,23 +84,12 @@ def main() -> None:
 @click.option("--state", default=None, help="Filter by state name (e.g. UP, Maharashtra)")
 def prices(commodity: str, state: str | None) -> None:
     """Show mandi prices for a commodity. Loads sample data for demonstration."""
+    from .core import MandiPriceTracker
+
     tracker = MandiPriceTracker()
 
     # Load sample data for demonstration
-    today = date.today().isoformat()
-    sample_prices = [
-        MandiPrice(commodity="rice", market="Azadpur", state="Delhi", min_price=1800.0, max_price=2200.0, modal_price=2000.0, date=today),
-        MandiPrice(commodity="rice", market="Lucknow", state="UP", min_price=1750.0, max_price=2100.0, modal_price=1950.0, date=today),
-        MandiPrice(commodity="rice", market="Patna", state="Bihar", min_price=1700.0, max_price=2050.0, modal_price=1900.0, date=today),
-        MandiPrice(commodity="wheat", market="Azadpur", state="Delhi", min_price=2000.0, max_price=2350.0, modal_price=2150.0, date=today),
-        MandiPrice(commodity="wheat", market="Lucknow", state="UP", min_price=1950.0, max_price=2300.0, modal_price=2100.0, date=today),
-        MandiPrice(commodity="cotton", market="Akola", state="Maharashtra", min_price=6000.0, max_price=6800.0, modal_price=6400.0, date=today),
-        MandiPrice(commodity="cotton", market="Warangal", state="Telangana", min_price=5900.0, max_price=6700.0, modal_price=6300.0, date=today),
-        MandiPrice(commodity="onion", market="Nashik", state="Maharashtra", min_price=1200.0, max_price=2000.0, modal_price=1600.0, date=today),
-        MandiPrice(commodity="potato", market="Agra", state="UP", min_price=800.0, max_price=1200.0, modal_price=1000.0, date=today),
-    ]
-    for price in sample_prices:
-        tracker.add_price(price)
+    tracker.bulk_add(_sample_prices())
 
     results = tracker.get_prices(commodity, state)
     if not results:
@@ -46,13 +97,18 @@ def prices(commodity: str, state: str | None) -> None:
         click.echo("\nNote: Connect to Agmarknet API for live prices.")
         return
 
-    click.echo(f"\nMANDI PRICES: {commodity.upper()}" + (f" | State: {state}" if state else ""))
-    click.echo(f"{'Market':<20} {'State':<15} {'Min':>8} {'Max':>8} {'Modal':>8} {'Date':<12}")
-    click.echo("-" * 75)
-    for p in results:
-        click.echo(f"{p.market:<20} {p.state:<15} {p.min_price:>8.0f} {p.max_price:>8.0f} {p.modal_price:>8.0f} {p.date:<12}")
-    click.echo("\n(Prices in INR per quintal)")
-    click.echo(f"\n{AGRICULTURAL_DISCLAIMER}\n")
+    lines = [
+        f"\nMANDI PRICES: {commodity.upper()}" + (f" | State: {state}" if state else ""),
+        _PRICE_HEADER("Market", "State", "Min", "Max", "Modal", "Date"),
+        "-" * 75,
+    ]
+    lines.extend(
+        _PRICE_ROW(p.market, p.state, p.min_price, p.max_price, p.modal_price, p.date)
+        for p in results
+    )
+    lines.append("\n(Prices in INR per quintal)")
+    lines.append(_disclaimer_block())
+    click.echo("\n".join(lines))
 
 
 @main.command("pest")
@@ -60,15 +116,15 @@ def prices(commodity: str, state: str | None) -> None:
 @click.option("--crop", default=None, help="Crop name to filter results")
 def pest(symptoms: str, crop: str | None) -> None:
     """Identify pests based on observed symptoms."""
-    db = PestDatabase()
-    symptom_list = [s.strip() for s in symptoms.split(",") if s.strip()]
+    from .core import get_pest_database
+
+    db = get_pest_database()
+    symptom_list = [s.lower() for s in _SYMPTOM_SEP.split(symptoms.strip()) if s]
 
     if crop:
-        candidates = db.by_crop(crop)
-        candidate_names = {p.name for p in candidates}
-        results = [p for p in db.identify(symptom_list) if p.name in candidate_names]
+        results = db.identify(symptom_list, crop=crop)
         if not results:
-            results = candidates
+            results = db.by_crop(crop)
     else:
         results = db.identify(symptom_list)
 
@@ -77,20 +133,16 @@ def pest(symptoms: str, crop: str | None) -> None:
         click.echo("Common symptoms: yellowing, wilting, spots, holes, rotting, stunted growth")
         return
 
-    click.echo(f"\nPEST IDENTIFICATION RESULTS ({len(results)} match(es)):")
-    for i, pest_info in enumerate(results[:5], 1):
-        click.echo(f"\n{'='*50}")
-        click.echo(f"{i}. {pest_info.name}")
-        click.echo(f"   Affected Crops: {', '.join(pest_info.affected_crops)}")
-        click.echo(f"   Symptoms: {'; '.join(pest_info.symptoms)}")
-        click.echo("   Treatment:")
-        for t in pest_info.treatment:
-            click.echo(f"     - {t}")
-        click.echo("   Prevention:")
-        for p_item in pest_info.prevention:
-            click.echo(f"     - {p_item}")
-
-    click.echo(f"\n{AGRICULTURAL_DISCLAIMER}\n")
+    lines = itertools.chain(
+        (f"\nPEST IDENTIFICATION RESULTS ({len(results)} match(es)):",),
+        itertools.chain.from_iterable(
+            _format_pest(i, pest_info)
+            for i, pest_info in enumerate(results[:5], 1)
+        ),
+        (_disclaimer_block(),),
+    )
+    # One buffered write; pages automatically on an interactive terminal.
+    click.echo_via_pager("\n".join(lines))
 
 
 @main.command("ask")
@@ -99,17 +151,19 @@ def pest(symptoms: str, crop: str | None) -> None:
 @click.option("--language", default="en", help="Language code")
 def ask(query: str, location: str | None, language: str) -> None:
     """Ask a farming question and get an advisory response."""
-    assistant = FarmerAssistant()
+    from .core import get_farmer_assistant
+    from .models import FarmerQuery
+
+    assistant = get_farmer_assistant()
     farmer_query = FarmerQuery(query=query, language=language, location=location)
     response = assistant.respond(farmer_query)
 
-    click.echo(f"\nADVISORY RESPONSE:")
-    click.echo(f"{response.answer}")
+    out = ["\nADVISORY RESPONSE:", response.answer]
     if response.sources:
-        click.echo("\nSources:")
-        for source in response.sources:
-            click.echo(f"  - {source}")
-    click.echo(f"\n{AGRICULTURAL_DISCLAIMER}\n")
+        out.append("\nSources:")
+        out.extend(f"  - {source}" for source in response.sources)
+    out.append(_disclaimer_block())
+    click.echo("\n".join(out))
 
 
 @main.command("serve")
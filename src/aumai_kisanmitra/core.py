@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import re
+import sys
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import date
+
+from pydantic import TypeAdapter
 
 from .models import (
     AGRICULTURAL_DISCLAIMER,
@@ -12,13 +20,19 @@ from .models import (
     PestInfo,
 )
 
-__all__ = ["MandiPriceTracker", "PestDatabase", "FarmerAssistant"]
+__all__ = [
+    "MandiPriceTracker",
+    "PestDatabase",
+    "FarmerAssistant",
+    "get_pest_database",
+    "get_farmer_assistant",
+]
 
 # ---------------------------------------------------------------------------
 # Static pest catalogue — 30+ common Indian agricultural pests
 # ---------------------------------------------------------------------------
 
-_RAW_PESTS: list[dict[str, object]] = [
+_RAW_PESTS: tuple[dict[str, object], ...] = (
     {
         "name": "Brown Plant Hopper",
         "affected_crops": ["Rice"],
@@ -229,85 +243,188 @@ _RAW_PESTS: list[dict[str, object]] = [
         "treatment": ["Wettable sulphur 80 WP @ 2 g/l water", "Dicofol 18.5 EC"],
         "prevention": ["Avoid water stress", "Remove dried leaves", "Summer spraying"],
     },
-]
+)
+
+
+# Built once so bulk loads validate through pydantic's compiled core in a
+# single call instead of one model construction per row.
+_PRICE_ROWS_ADAPTER: TypeAdapter[list[MandiPrice]] = TypeAdapter(list[MandiPrice])
+_PESTS_ADAPTER: TypeAdapter[tuple[PestInfo, ...]] = TypeAdapter(tuple[PestInfo, ...])
+
+
+class _Bucket:
+    """Date-ordered price records with parallel lists of integer sort keys.
+
+    Dates are converted once at insertion to epoch ordinals, so placing a
+    record is a bisect over ints rather than repeated string comparisons.
+    Both views keep records with equal dates in insertion order, matching
+    a stable sort in either direction.
+    """
+
+    __slots__ = ("records", "records_desc", "_ordinals", "_neg_ordinals")
+
+    def __init__(self) -> None:
+        self.records: list[MandiPrice] = []
+        self.records_desc: list[MandiPrice] = []
+        self._ordinals: list[int] = []
+        self._neg_ordinals: list[int] = []
+
+    def insert(self, price: MandiPrice, date_ord: int) -> None:
+        pos = bisect.bisect_right(self._ordinals, date_ord)
+        self._ordinals.insert(pos, date_ord)
+        self.records.insert(pos, price)
+        pos = bisect.bisect_right(self._neg_ordinals, -date_ord)
+        self._neg_ordinals.insert(pos, -date_ord)
+        self.records_desc.insert(pos, price)
 
 
 class MandiPriceTracker:
     """In-memory store for mandi commodity prices with query and trend utilities."""
 
     def __init__(self) -> None:
-        # Map: (commodity_lower, state_lower, market_lower) -> list of prices
         self._store: list[MandiPrice] = []
+        # Cached all_prices() snapshot, invalidated on writes.
+        self._all_cache: tuple[MandiPrice, ...] | None = None
+        # Secondary indexes keyed by lowercased commodity, (commodity,
+        # state) and (commodity, market) so every query path is a hash
+        # lookup instead of a full-store scan. Buckets are kept sorted
+        # by date at insertion, so queries never re-sort.
+        self._by_commodity: dict[str, _Bucket] = defaultdict(_Bucket)
+        self._by_comm_state: dict[tuple[str, str], _Bucket] = defaultdict(_Bucket)
+        self._by_comm_market: dict[tuple[str, str], _Bucket] = defaultdict(_Bucket)
 
     def add_price(self, price: MandiPrice) -> None:
         """Add a mandi price record to the tracker."""
+        # Parse the date before touching any state so a record that dodged
+        # validation (e.g. via model_construct) fails without mutating us.
+        date_ord = date.fromisoformat(price.date).toordinal()
+        comm_lower = price.commodity.lower()
         self._store.append(price)
+        self._all_cache = None
+        self._by_commodity[comm_lower].insert(price, date_ord)
+        self._by_comm_state[(comm_lower, price.state.lower())].insert(price, date_ord)
+        self._by_comm_market[(comm_lower, price.market.lower())].insert(price, date_ord)
+
+    def bulk_add(self, prices: Iterable[MandiPrice]) -> None:
+        """Add multiple mandi price records in a single batched call."""
+        for price in prices:
+            self.add_price(price)
+
+    def load_rows(self, rows: list[dict[str, object]]) -> None:
+        """Validate and add raw AGMARKNET-style row dicts in one batch."""
+        self.bulk_add(_PRICE_ROWS_ADAPTER.validate_python(rows))
 
     def get_prices(
         self, commodity: str, state: str | None = None
     ) -> list[MandiPrice]:
         """Return all price records for a commodity, optionally filtered by state."""
         comm_lower = commodity.lower()
-        results = [p for p in self._store if p.commodity.lower() == comm_lower]
         if state:
-            state_lower = state.lower()
-            results = [p for p in results if p.state.lower() == state_lower]
-        return sorted(results, key=lambda p: p.date, reverse=True)
+            bucket = self._by_comm_state.get((comm_lower, state.lower()))
+        else:
+            bucket = self._by_commodity.get(comm_lower)
+        return list(bucket.records_desc) if bucket else []
 
     def price_trend(self, commodity: str, market: str) -> list[MandiPrice]:
         """Return chronological price records for a commodity at a specific market."""
-        comm_lower = commodity.lower()
-        mkt_lower = market.lower()
-        results = [
-            p for p in self._store
-            if p.commodity.lower() == comm_lower and p.market.lower() == mkt_lower
-        ]
-        return sorted(results, key=lambda p: p.date)
+        bucket = self._by_comm_market.get((commodity.lower(), market.lower()))
+        return list(bucket.records) if bucket else []
+
+    def all_prices(self) -> tuple[MandiPrice, ...]:
+        """Return all stored price records as an immutable snapshot.
+
+        The tuple is cached and only rebuilt after new records arrive.
+        """
+        if self._all_cache is None:
+            self._all_cache = tuple(self._store)
+        return self._all_cache
 
-    def all_prices(self) -> list[MandiPrice]:
-        """Return all stored price records."""
-        return list(self._store)
+
+def _bit_indices(mask: int) -> Iterator[int]:
+    """Yield the set-bit positions of a pest bitmask in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
 
 
 class PestDatabase:
     """Repository of Indian agricultural pests with symptom-based identification."""
 
     def __init__(self) -> None:
-        self._pests: list[PestInfo] = [PestInfo(**entry) for entry in _RAW_PESTS]  # type: ignore[arg-type]
-
-    def all_pests(self) -> list[PestInfo]:
-        """Return all pests in the database."""
-        return list(self._pests)
-
-    def identify(self, symptoms: list[str]) -> list[PestInfo]:
-        """Return pests whose symptom set overlaps with the provided symptoms."""
-        symptoms_lower = {s.lower() for s in symptoms}
-        scored: list[tuple[int, PestInfo]] = []
-        for pest in self._pests:
-            pest_symptoms_lower = {s.lower() for s in pest.symptoms}
-            overlap = sum(
-                1 for s in symptoms_lower
-                if any(s in ps for ps in pest_symptoms_lower)
-            )
-            if overlap > 0:
-                scored.append((overlap, pest))
+        self._pests: tuple[PestInfo, ...] = _PESTS_ADAPTER.validate_python(_RAW_PESTS)
+        # Lowercased symptom tuples per pest, computed once so identify()
+        # never re-lowercases catalogue strings.
+        self._symptoms_lc: list[tuple[str, ...]] = [
+            tuple(sys.intern(s.lower()) for s in pest.symptoms) for pest in self._pests
+        ]
+        # Inverted index: known symptom phrase -> bitmask of pests with a
+        # symptom containing that phrase (bit i set for pest i),
+        # precomputed with the same containment rule identify() applies
+        # to unknown phrases. Single tokens of each phrase are indexed
+        # too, so one-word queries like "yellowing" hit the index instead
+        # of the fallback scan.
+        keys = {s for symptoms in self._symptoms_lc for s in symptoms}
+        keys.update(tok for phrase in tuple(keys) for tok in phrase.split())
+        self._symptom_index: dict[str, int] = {
+            key: self._matching_mask(key) for key in keys
+        }
+        # Crop index: lowercased crop name -> bitmask of pests affecting it.
+        self._by_crop: dict[str, int] = defaultdict(int)
+        for i, pest in enumerate(self._pests):
+            for crop in pest.affected_crops:
+                self._by_crop[crop.lower()] |= 1 << i
+
+    def _matching_mask(self, symptom: str) -> int:
+        """Return a bitmask of pests with a symptom containing the given phrase."""
+        mask = 0
+        for i, pest_symptoms in enumerate(self._symptoms_lc):
+            if any(symptom in ps for ps in pest_symptoms):
+                mask |= 1 << i
+        return mask
+
+    def all_pests(self) -> tuple[PestInfo, ...]:
+        """Return all pests in the database as an immutable snapshot."""
+        return self._pests
+
+    def identify(
+        self, symptoms: list[str], crop: str | None = None
+    ) -> list[PestInfo]:
+        """Return pests whose symptom set overlaps with the provided symptoms.
+
+        When ``crop`` is given, results are restricted to pests affecting
+        that crop.
+        """
+        allowed = -1 if crop is None else self._by_crop.get(crop.lower(), 0)
+        masks = []
+        union = 0
+        for s in {s.lower() for s in symptoms}:
+            mask = self._symptom_index.get(s)
+            if mask is None:
+                # Unknown phrase: fall back to the containment scan the
+                # index was built with.
+                mask = self._matching_mask(s)
+            masks.append(mask)
+            union |= mask
+        union &= allowed
+        # Each pest's score is the number of query phrases whose hit mask
+        # covers it; bits come out in ascending pest order, so the stable
+        # sort keeps the catalogue-order tie-break.
+        scored = [(sum((m >> i) & 1 for m in masks), i) for i in _bit_indices(union)]
         scored.sort(key=lambda x: x[0], reverse=True)
-        return [pest for _, pest in scored]
+        return [self._pests[i] for _, i in scored]
 
     def by_crop(self, crop_name: str) -> list[PestInfo]:
         """Return pests affecting a specific crop."""
-        crop_lower = crop_name.lower()
-        return [
-            p for p in self._pests
-            if any(c.lower() == crop_lower for c in p.affected_crops)
-        ]
+        mask = self._by_crop.get(crop_name.lower(), 0)
+        return [self._pests[i] for i in _bit_indices(mask)]
 
 
 # ---------------------------------------------------------------------------
 # Farmer assistant
 # ---------------------------------------------------------------------------
 
-_KEYWORD_RESPONSES: list[tuple[list[str], str, list[str]]] = [
+_RAW_KEYWORD_RESPONSES: list[tuple[list[str], str, list[str]]] = [
     (
         ["price", "mandi", "rate", "sell", "market"],
         "Mandi prices vary by location and date. Use the 'prices' command or API to fetch current prices for your commodity and state. Agmarknet (agmarknet.gov.in) publishes daily mandi arrivals and prices across India.",
@@ -355,37 +472,101 @@ _KEYWORD_RESPONSES: list[tuple[list[str], str, list[str]]] = [
     ),
 ]
 
+# Rebuilt once at import as immutable tuples with interned lowercase
+# keywords, so the hot loops iterate shared, hash-stable strings.
+_KEYWORD_RESPONSES: tuple[tuple[tuple[str, ...], str, tuple[str, ...]], ...] = tuple(
+    (tuple(sys.intern(kw.lower()) for kw in keywords), answer, tuple(sources))
+    for keywords, answer, sources in _RAW_KEYWORD_RESPONSES
+)
+
+
+def _build_keyword_matcher() -> tuple[re.Pattern[str], dict[str, tuple[int, ...]]]:
+    """Compile one pattern matching every advisory keyword in a single scan.
+
+    The lookahead makes the scan overlapping, so keywords nested inside
+    longer keywords are still reported; the returned mapping resolves each
+    keyword to the rule groups it scores for ("rain" appears in two).
+    """
+    groups: dict[str, list[int]] = defaultdict(list)
+    for i, (keywords, _, _) in enumerate(_KEYWORD_RESPONSES):
+        for kw in keywords:
+            groups[kw].append(i)
+    alternation = "|".join(
+        re.escape(kw) for kw in sorted(groups, key=len, reverse=True)
+    )
+    pattern = re.compile(f"(?=({alternation}))")
+    return pattern, {kw: tuple(indices) for kw, indices in groups.items()}
+
+
+_KEYWORD_PATTERN, _KEYWORD_GROUPS = _build_keyword_matcher()
+
+
+@functools.lru_cache(maxsize=1024)
+def _best_match(query_lower: str) -> tuple[str, tuple[str, ...]]:
+    """Return (answer, sources) for the best-scoring rule group.
+
+    Farmer queries are short and repetitive, so the scoring result is
+    memoized on the normalized query text. The location suffix varies
+    per caller and is appended outside the cache.
+    """
+    best_answer = (
+        "I can help with crop prices, pest identification, fertilizers, irrigation,"
+        " seeds, weather, loans, insurance, and MSP. Please describe your query in more"
+        " detail or use specific commands for prices and pest identification."
+    )
+    best_sources: tuple[str, ...] = ("Kisan Call Centre (1800-180-1551)", "Kisan Suvidha App")
+
+    # One pass over the query finds every keyword; each distinct
+    # keyword counts once per rule group, as before.
+    matched = {m.group(1) for m in _KEYWORD_PATTERN.finditer(query_lower)}
+    scores = [0] * len(_KEYWORD_RESPONSES)
+    for kw in matched:
+        for group_index in _KEYWORD_GROUPS[kw]:
+            scores[group_index] += 1
+
+    best_score = 0
+    for i, score in enumerate(scores):
+        if score > best_score:
+            best_score = score
+            _, best_answer, best_sources = _KEYWORD_RESPONSES[i]
+    return best_answer, best_sources
+
 
 class FarmerAssistant:
     """Rule-based assistant that answers farmer queries with keyword matching."""
 
     def respond(self, query: FarmerQuery) -> FarmerResponse:
         """Return an advisory response to the farmer's query."""
-        query_lower = query.query.lower()
-        best_answer = (
-            "I can help with crop prices, pest identification, fertilizers, irrigation,"
-            " seeds, weather, loans, insurance, and MSP. Please describe your query in more"
-            " detail or use specific commands for prices and pest identification."
-        )
-        best_sources: list[str] = ["Kisan Call Centre (1800-180-1551)", "Kisan Suvidha App"]
-
-        best_score = 0
-        for keywords, answer, sources in _KEYWORD_RESPONSES:
-            score = sum(1 for kw in keywords if kw in query_lower)
-            if score > best_score:
-                best_score = score
-                best_answer = answer
-                best_sources = sources
+        best_answer, best_sources = _best_match(query.query.lower())
 
+        # Assemble the answer from parts so extending it stays linear.
+        parts = [best_answer]
         if query.location:
-            best_answer += (
+            parts.append(
                 f" For location-specific advice in {query.location}, contact your"
                 " local Block Agriculture Officer or Krishi Vigyan Kendra."
             )
 
         return FarmerResponse(
-            answer=best_answer,
-            sources=best_sources,
+            answer="".join(parts),
+            sources=list(best_sources),
             language=query.language,
             disclaimer=AGRICULTURAL_DISCLAIMER,
         )
+
+
+# ---------------------------------------------------------------------------
+# Shared instances
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=1)
+def get_pest_database() -> PestDatabase:
+    """Return a process-wide PestDatabase, built on first use."""
+    return PestDatabase()
+
+
+@functools.lru_cache(maxsize=1)
+def get_farmer_assistant() -> FarmerAssistant:
+    """Return a process-wide FarmerAssistant, built on first use."""
+    return FarmerAssistant()
@@ -1,8 +1,21 @@
-"""Pydantic v2 models for aumai-kisanmitra farmer assistant."""
+"""Pydantic v2 models for aumai-kisanmitra farmer assistant.
+
+The model classes are defined in `_schemas` and loaded lazily here via
+PEP 562, so importers that only need ``AGRICULTURAL_DISCLAIMER`` never
+pay the pydantic import cost.
+"""
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._schemas import (  # noqa: F401
+        FarmerQuery,
+        FarmerResponse,
+        MandiPrice,
+        PestInfo,
+    )
 
 AGRICULTURAL_DISCLAIMER = (
     "This tool does not replace professional agronomic advice."
@@ -18,44 +31,14 @@ __all__ = [
     "AGRICULTURAL_DISCLAIMER",
 ]
 
+_MODEL_NAMES = frozenset({"MandiPrice", "PestInfo", "FarmerQuery", "FarmerResponse"})
 
-class MandiPrice(BaseModel):
-    """Mandi (agricultural market) price record for a commodity."""
-
-    commodity: str = Field(..., description="Name of the agricultural commodity")
-    market: str = Field(..., description="Name of the mandi/market")
-    state: str = Field(..., description="State where the mandi is located")
-    min_price: float = Field(..., ge=0.0, description="Minimum price in INR per quintal")
-    max_price: float = Field(..., ge=0.0, description="Maximum price in INR per quintal")
-    modal_price: float = Field(..., ge=0.0, description="Modal (most common) price in INR per quintal")
-    date: str = Field(..., description="Date of price record in YYYY-MM-DD format")
-
-
-class PestInfo(BaseModel):
-    """Information about an agricultural pest or disease."""
 
-    name: str = Field(..., description="Common name of the pest or disease")
-    affected_crops: list[str] = Field(..., description="Crops affected by this pest")
-    symptoms: list[str] = Field(..., description="Observable symptoms of infestation")
-    treatment: list[str] = Field(..., description="Recommended treatment measures")
-    prevention: list[str] = Field(..., description="Preventive measures to avoid infestation")
+def __getattr__(name: str) -> object:
+    if name in _MODEL_NAMES:
+        from . import _schemas
 
-
-class FarmerQuery(BaseModel):
-    """A query submitted by a farmer."""
-
-    query: str = Field(..., description="The farmer's question or concern")
-    language: str = Field(default="en", description="Language code for the query")
-    location: str | None = Field(default=None, description="Farmer's location for context")
-
-
-class FarmerResponse(BaseModel):
-    """Response to a farmer query with sources and disclaimer."""
-
-    answer: str = Field(..., description="The advisory response")
-    sources: list[str] = Field(default_factory=list, description="Sources or references")
-    language: str = Field(default="en", description="Language of the response")
-    disclaimer: str = Field(
-        default=AGRICULTURAL_DISCLAIMER,
-        description="Mandatory agricultural disclaimer",
-    )
+        value = getattr(_schemas, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1 +1,25 @@
 """Shared test fixtures."""
+
+import os
+
+from hypothesis import HealthCheck, Phase, settings
+
+# Property-test budgets: CI keeps example counts small since the
+# never-raises properties gain little past the first few examples;
+# dev is a tiny deterministic run for quick local iteration; nightly
+# digs much deeper. Select with HYPOTHESIS_PROFILE.
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink],
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile(
+    "dev",
+    max_examples=10,
+    derandomize=True,
+    deadline=None,
+)
+settings.register_profile("nightly", max_examples=500, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))